@@ -13,14 +13,15 @@
 from __future__ import annotations
 
 import csv
+import functools
 import random
-from collections import deque
-from dataclasses import dataclass, replace
-from enum import Enum, auto
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, NamedTuple, Sequence, Tuple
 
 import pyray as rl  # pyray = snake_case wrapper over raylib C API :contentReference[oaicite:3]{index=3}
+import raylib  # raw cffi C API (CamelCase); no per-call argument marshalling
 import settings as cfg
 
 # =========================
@@ -30,26 +31,26 @@ import settings as cfg
 BG = "#b4ddc7"
 
 
-# [VALUES][DATA>SYNTAX] plain, immutable domain items
-@dataclass(frozen=True)
-class WordPair:
+# [VALUES][DATA>SYNTAX] plain, immutable domain items (tuple-backed: small, C hash)
+class WordPair(NamedTuple):
     fr: str
     en: str
 
 
 # [VALUES][DATA>SYNTAX] config as pure data
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeSpec:
     canvas_size: Tuple[int, int] = (800, 526)
     title_pos: Tuple[int, int] = (400, 175)  # center within card
     word_pos: Tuple[int, int] = (400, 350)  # center within card
-    title_font_size: int = 40
-    word_font_size: int = 60
+    # float: raylib draws/measures in float sizes, so cache keys stay consistent
+    title_font_size: float = 40.0
+    word_font_size: float = 60.0
     text_spacing: float = 2.0  # raylib spacing
 
 
 # [VALUES] keep policy as data
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Policy:
     front_title: str = "French"
     back_title: str = "English"
@@ -62,9 +63,9 @@ class Policy:
 
 
 # [VALUES] model is an immutable snapshot of state
-@dataclass(frozen=True)
-class Model:
-    current: WordPair
+# [DATA>SYNTAX] current is an index into the loaded deck (parallel arrays below)
+class Model(NamedTuple):
+    current: int
     showing_back: bool = False
 
 
@@ -72,12 +73,12 @@ class Model:
 def flip(model: Model) -> Model:
     if model.showing_back:
         return model
-    return replace(model, showing_back=True)
+    return Model(current=model.current, showing_back=True)
 
 
 # [WHAT] pure; selection happens at the edge and is passed in
-def next_card(model: Model, chosen: WordPair) -> Model:
-    return replace(model, current=chosen, showing_back=False)
+def next_card(model: Model, chosen: int) -> Model:
+    return Model(current=chosen, showing_back=False)
 
 
 # =========================
@@ -89,24 +90,33 @@ def next_card(model: Model, chosen: WordPair) -> Model:
 def load_word_pairs(csv_path: Path) -> tuple[WordPair, ...]:
     rows: list[WordPair] = []
     with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        # [NOTE] plain reader + header indices; no per-row dict like DictReader
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "French" not in header or "English" not in header:
+            return ()
+        fi = header.index("French")
+        ei = header.index("English")
+        width = max(fi, ei)
         for row in reader:
-            fr = (row.get("French") or "").strip()
-            en = (row.get("English") or "").strip()
+            if len(row) <= width:
+                continue
+            fr = row[fi].strip()
+            en = row[ei].strip()
             if fr and en:
-                rows.append(WordPair(fr=fr, en=en))
+                # interned: text-metrics lookups hit the identity fast path
+                rows.append(WordPair(fr=sys.intern(fr), en=sys.intern(en)))
     return tuple(rows)
 
 
-# =========================
-# Events (when/where decoupled)
-# =========================
-
-
-# [SMALL-IFACE] tiny, explicit intents
-class Event(Enum):
-    NEXT = auto()
-    AUTO_FLIP = auto()
+# [HOW] shuffled index bag: each card once per pass, O(1) draws via pop()
+# [NOTE] `avoid` keeps the card on screen from coming up first after a refill
+def refill_bag(n: int, avoid: int | None = None) -> list[int]:
+    bag = list(range(n))
+    random.shuffle(bag)
+    if n > 1 and bag[-1] == avoid:
+        bag[0], bag[-1] = bag[-1], bag[0]
+    return bag
 
 
 # =========================
@@ -114,40 +124,85 @@ class Event(Enum):
 # =========================
 
 
-# [HOW] UI color decode at the boundary
+# [HOW] UI color decode at the boundary; accepts "#RRGGBB" or "#RRGGBBAA"
+@functools.lru_cache(maxsize=None)
 def hex_to_color(s: str) -> rl.Color:
     s = s.lstrip("#")
-    r = int(s[0:2], 16)
-    g = int(s[2:4], 16)
-    b = int(s[4:6], 16)
-    return rl.Color(r, g, b, 255)
+    n = int(s, 16)
+    if len(s) == 8:
+        return rl.Color((n >> 24) & 0xFF, (n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF)
+    if len(s) != 6:
+        raise ValueError(f"expected 6 or 8 hex digits, got {s!r}")
+    return rl.Color((n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF, 255)
+
+
+# [DATA>SYNTAX] policy color names -> raylib colors (expand as needed)
+_COLOR_TABLE: dict[str, rl.Color] = {
+    "red": rl.RED,
+    "green": rl.GREEN,
+    "black": rl.BLACK,
+    "white": rl.RAYWHITE,
+    "gray": rl.GRAY,
+}
+
+
+# [HOW] policy colors mapped at the boundary
+@functools.lru_cache(maxsize=16)
+def color_from_name(name: str) -> rl.Color:
+    return _COLOR_TABLE.get(name.lower(), rl.BLACK)
 
 
-# [HOW] policy colors mapped at the boundary (expand as needed)
-def color_from_name(name: str) -> rl.Color:
-    name = name.lower()
-    table = {
-        "red": rl.RED,
-        "green": rl.GREEN,
-        "black": rl.BLACK,
-        "white": rl.RAYWHITE,
-        "gray": rl.GRAY,
-    }
-    return table.get(name, rl.BLACK)
-
-
-# [HOW] centered text (raylib has no "anchor=mm"; we measure and offset)
-def draw_text_centered(
+# [DATA>SYNTAX] (font, text, size, spacing) -> (w, h), filled at load time
+# [NOTE] fonts are loaded once and outlive the table, so the cdata is a stable key;
+#        unlike a bounded LRU it never evicts, however large the deck grows
+_TEXT_METRICS: dict[Tuple[rl.Font, str, float, float], Tuple[float, float]] = {}
+
+
+# [HOW] table lookup; only a miss crosses into raylib
+def measure_text(
+    font: rl.Font, text: str, font_size: float, spacing: float
+) -> Tuple[float, float]:
+    key = (font, text, font_size, spacing)
+    size = _TEXT_METRICS.get(key)
+    if size is None:
+        v = raylib.MeasureTextEx(font, text.encode("utf-8"), font_size, spacing)
+        size = _TEXT_METRICS[key] = (v.x, v.y)
+    return size
+
+
+# [HOW] top-left draw positions for centered texts, one per entry in `texts`
+# [DATA>SYNTAX] parallel to the deck so the render path is a plain index lookup
+def layout_centered(
     font: rl.Font,
-    text: str,
+    texts: Sequence[str],
     center_xy: Tuple[float, float],
     font_size: float,
     spacing: float,
-    color: rl.Color,
+) -> tuple[rl.Vector2, ...]:
+    out: list[rl.Vector2] = []
+    for text in texts:
+        w, h = measure_text(font, text, font_size, spacing)
+        out.append(rl.Vector2(center_xy[0] - w / 2.0, center_xy[1] - h / 2.0))
+    return tuple(out)
+
+
+# [HOW] compose one card face off-screen (base + text runs); the loop only blits it
+# [NOTE] called on card change, not per frame
+def bake_face(
+    target: rl.RenderTexture,
+    base: rl.Texture,
+    runs: Iterable[Tuple[rl.Font, str, rl.Vector2, float, rl.Color]],
+    spacing: float,
+    clear: rl.Color,
 ) -> None:
-    size = rl.measure_text_ex(font, text, font_size, spacing)
-    pos = rl.Vector2(center_xy[0] - size.x / 2.0, center_xy[1] - size.y / 2.0)
-    rl.draw_text_ex(font, text, pos, font_size, spacing, color)
+    rl.begin_texture_mode(target)
+    rl.clear_background(clear)
+    rl.begin_blend_mode(rl.BLEND_CUSTOM_SEPARATE)
+    rl.draw_texture(base, 0, 0, rl.WHITE)
+    for font, text, pos, font_size, color in runs:
+        raylib.DrawTextEx(font, text.encode("utf-8"), pos, font_size, spacing, color)
+    rl.end_blend_mode()
+    rl.end_texture_mode()
 
 
 # =========================
@@ -180,6 +235,19 @@ def main() -> None:
 
     bg_color = hex_to_color(BG)
 
+    # [HOW] off-screen blend: colour as BLEND_ALPHA, alpha saturates (ONE, ONE)
+    # [NOTE] plain BLEND_ALPHA also scales the target's alpha, leaving glyph and
+    #        corner edges translucent in the render textures; with an opaque
+    #        clear this keeps every baked pixel opaque, like drawing to screen
+    rl.rl_set_blend_factors_separate(
+        rl.RL_SRC_ALPHA,
+        rl.RL_ONE_MINUS_SRC_ALPHA,
+        rl.RL_ONE,
+        rl.RL_ONE,
+        rl.RL_FUNC_ADD,
+        rl.RL_FUNC_ADD,
+    )
+
     # [HOW] load textures/fonts once (GPU + font decode)
     card_front = rl.load_texture(cfg.asset("resources", "images", "card_front.png"))
     card_back = rl.load_texture(str(resources / "images" / "card_back.png"))
@@ -187,28 +255,101 @@ def main() -> None:
     right_tex = rl.load_texture(str(resources / "images" / "right.png"))
     # card_front = rl.load_texture(str(resources / "images" / "card_front.png"))
     title_font = rl.load_font_ex(
-        str(resources / "fonts" / "Roboto-Italic.ttf"), theme.title_font_size, None, 0
+        str(resources / "fonts" / "Roboto-Italic.ttf"),
+        int(theme.title_font_size),
+        None,
+        0,
     )
     word_font = rl.load_font_ex(
-        str(resources / "fonts" / "Roboto-Bold.ttf"), theme.word_font_size, None, 0
+        str(resources / "fonts" / "Roboto-Bold.ttf"), int(theme.word_font_size), None, 0
     )
 
-    # Model (pure state)
-    # [HOW] randomness at edge
-    model = Model(current=random.choice(word_pairs))
-
-    # ---- Event system ----
-    # [QUEUES] decouple input/time from pure updates
-    events: deque[Event] = deque()
-
-    # [WHEN] timer state at the boundary
-    time_since_next = 0.0
-
     # Layout (edge/UI concerns)
     card_w, card_h = theme.canvas_size
     card_x = (win_w - card_w) // 2
     card_y = 60
 
+    # [HOW] frame-invariant layout values, computed once outside the loop
+    # [NOTE] text is baked into card-sized targets, so positions are card-local
+    title_fs = theme.title_font_size
+    word_fs = theme.word_font_size
+    front_title_pos, back_title_pos = layout_centered(
+        title_font,
+        (policy.front_title, policy.back_title),
+        theme.title_pos,
+        title_fs,
+        theme.text_spacing,
+    )
+
+    # [DATA>SYNTAX] deck as parallel arrays: texts + precomputed word positions
+    # [NOTE] laying out the deck fills the text-metrics table for every word
+    fr_texts = tuple(p.fr for p in word_pairs)
+    en_texts = tuple(p.en for p in word_pairs)
+    fr_word_pos = layout_centered(
+        word_font,
+        fr_texts,
+        theme.word_pos,
+        word_fs,
+        theme.text_spacing,
+    )
+    en_word_pos = layout_centered(
+        word_font,
+        en_texts,
+        theme.word_pos,
+        word_fs,
+        theme.text_spacing,
+    )
+
+    # [HOW] off-screen card faces, rebaked only when the card changes
+    face_w, face_h = card_front.width, card_front.height
+    front_rt = rl.load_render_texture(face_w, face_h)
+    back_rt = rl.load_render_texture(face_w, face_h)
+    # render textures are stored bottom-up; a negative height flips the blit
+    face_src = rl.Rectangle(0, 0, face_w, -face_h)
+
+    # [HOW] policy colors resolved once, not on every bake
+    title_color = color_from_name(policy.title_color)
+    word_color = color_from_name(policy.word_color)
+
+    def bake_card(i: int) -> None:
+        bake_face(
+            front_rt,
+            card_front,
+            (
+                (
+                    title_font,
+                    policy.front_title,
+                    front_title_pos,
+                    title_fs,
+                    title_color,
+                ),
+                (word_font, fr_texts[i], fr_word_pos[i], word_fs, word_color),
+            ),
+            theme.text_spacing,
+            bg_color,
+        )
+        bake_face(
+            back_rt,
+            card_back,
+            (
+                (title_font, policy.back_title, back_title_pos, title_fs, title_color),
+                (word_font, en_texts[i], en_word_pos[i], word_fs, word_color),
+            ),
+            theme.text_spacing,
+            bg_color,
+        )
+
+    # Model (pure state)
+    # [HOW] randomness at edge: draw without repeats from a shuffled bag
+    bag = refill_bag(len(word_pairs))
+    model = Model(current=bag.pop())
+    bake_card(model.current)
+    # [HOW] face on screen: written only by the reducer, read by compose
+    face = front_rt
+
+    # [WHEN] timer state at the boundary
+    time_since_next = 0.0
+
     # Buttons hitboxes
     btn_size = 80
     btn_y = card_y + card_h + 35
@@ -216,92 +357,130 @@ def main() -> None:
     right_x = (win_w // 2) + 120
     wrong_rect = rl.Rectangle(wrong_x, btn_y, btn_size, btn_size)
     right_rect = rl.Rectangle(right_x, btn_y, btn_size, btn_size)
+    wrong_scale = btn_size / max(1, wrong_tex.width)
+    right_scale = btn_size / max(1, right_tex.width)
+
+    # [HOW] hitbox edges as plain ints: a click test needs no FFI round-trip
+    btn_y1 = btn_y + btn_size
+    wrong_x1 = wrong_x + btn_size
+    right_x1 = right_x + btn_size
+
+    # [HOW] draw positions allocated once; nothing on screen moves
+    card_pos = rl.Vector2(card_x, card_y)
+    wrong_pos = rl.Vector2(wrong_x, btn_y)
+    right_pos = rl.Vector2(right_x, btn_y)
+    origin = rl.Vector2(0, 0)
+
+    # [HOW] whole-window frame cache, recomposed only when the model changes
+    # [NOTE] raylib swaps buffers on every end_drawing(), so a clean frame must
+    #        still present something: it blits the cached scene in one call
+    scene_rt = rl.load_render_texture(win_w, win_h)
+    scene_src = rl.Rectangle(0, 0, win_w, -win_h)
+    dirty = True
+
+    # [HOW] bind hot raylib entry points to locals (LOAD_FAST in the loop)
+    # [NOTE] the raw cffi functions skip pyray's per-call wrapper, which inspects
+    #        and converts every argument and return value in Python
+    begin_blend_mode = raylib.BeginBlendMode
+    begin_drawing = raylib.BeginDrawing
+    begin_texture_mode = raylib.BeginTextureMode
+    clear_background = raylib.ClearBackground
+    draw_rectangle_lines_ex = raylib.DrawRectangleLinesEx
+    draw_texture_ex = raylib.DrawTextureEx
+    draw_texture_rec = raylib.DrawTextureRec
+    end_blend_mode = raylib.EndBlendMode
+    end_drawing = raylib.EndDrawing
+    end_texture_mode = raylib.EndTextureMode
+    get_frame_time = raylib.GetFrameTime
+    get_mouse_position = raylib.GetMousePosition
+    is_key_pressed = raylib.IsKeyPressed
+    is_mouse_button_pressed = raylib.IsMouseButtonPressed
+    window_should_close = raylib.WindowShouldClose
+    BLACK = rl.BLACK
+    BLEND_CUSTOM_SEPARATE = rl.BLEND_CUSTOM_SEPARATE
+    KEY_SPACE = rl.KEY_SPACE
+    MOUSE_BUTTON_LEFT = rl.MOUSE_BUTTON_LEFT
+    WHITE = rl.WHITE
 
     # Main loop
-    while not rl.window_should_close():  # :contentReference[oaicite:5]{index=5}
+    while not window_should_close():  # :contentReference[oaicite:5]{index=5}
         # [WHEN] frame-time (seconds) :contentReference[oaicite:6]{index=6}
-        dt = rl.get_frame_time()
+        dt = get_frame_time()
         time_since_next += dt
 
-        # [WHEN -> QUEUES] schedule auto-flip intent (no direct mutation here)
-        if (not model.showing_back) and (time_since_next >= policy.flip_delay_s):
-            events.append(Event.AUTO_FLIP)
-
-        # [HOW -> QUEUES] input edge emits intents :contentReference[oaicite:7]{index=7}
-        if rl.is_mouse_button_pressed(rl.MOUSE_BUTTON_LEFT):
-            mp = rl.get_mouse_position()
-            if rl.check_collision_point_rec(
-                mp, wrong_rect
-            ) or rl.check_collision_point_rec(mp, right_rect):
-                events.append(Event.NEXT)
+        # [HOW] input edge reads intents :contentReference[oaicite:7]{index=7}
+        next_requested = False
+        if is_mouse_button_pressed(MOUSE_BUTTON_LEFT):
+            mp = get_mouse_position()
+            mx, my = mp.x, mp.y
+            # plain int compares (same half-open bounds as CheckCollisionPointRec)
+            next_requested = btn_y <= my < btn_y1 and (
+                wrong_x <= mx < wrong_x1 or right_x <= mx < right_x1
+            )
 
         # Optional keyboard shortcuts (edge)
-        if rl.is_key_pressed(rl.KEY_SPACE):
-            events.append(Event.NEXT)
-
-        # [QUEUES] reducer: single sequencing point
-        while events:
-            ev = events.popleft()
-            if ev is Event.NEXT:
-                chosen = random.choice(word_pairs)  # [HOW] randomness at edge
-                model = next_card(model, chosen)  # [WHAT]
-                time_since_next = 0.0  # [WHEN] reset timer at edge
-            elif ev is Event.AUTO_FLIP:
-                model = flip(model)  # [WHAT]
-
-        # Draw (edge)
-        rl.begin_drawing()
-        rl.clear_background(bg_color)
-
-        # Card base
-        tex = card_back if model.showing_back else card_front
-        rl.draw_texture(tex, card_x, card_y, rl.WHITE)
-
-        # Text overlay (computed from pure model + policy)
-        title = policy.back_title if model.showing_back else policy.front_title
-        word = model.current.en if model.showing_back else model.current.fr
-
-        title_center = (card_x + theme.title_pos[0], card_y + theme.title_pos[1])
-        word_center = (card_x + theme.word_pos[0], card_y + theme.word_pos[1])
-
-        draw_text_centered(
-            title_font,
-            title,
-            title_center,
-            float(theme.title_font_size),
-            theme.text_spacing,
-            color_from_name(policy.title_color),
-        )
-        draw_text_centered(
-            word_font,
-            word,
-            word_center,
-            float(theme.word_font_size),
-            theme.text_spacing,
-            color_from_name(policy.word_color),
-        )
+        if is_key_pressed(KEY_SPACE):
+            next_requested = True
 
-        # Buttons (simple sprites + hitboxes)
-        rl.draw_rectangle_lines_ex(wrong_rect, 2, rl.BLACK)
-        rl.draw_rectangle_lines_ex(right_rect, 2, rl.BLACK)
-        rl.draw_texture_ex(
-            wrong_tex,
-            rl.Vector2(wrong_x, btn_y),
-            0.0,
-            btn_size / max(1, wrong_tex.width),
-            rl.WHITE,
-        )
-        rl.draw_texture_ex(
-            right_tex,
-            rl.Vector2(right_x, btn_y),
-            0.0,
-            btn_size / max(1, right_tex.width),
-            rl.WHITE,
-        )
-
-        rl.end_drawing()
+        # [WHAT] reducer, called inline: intents are produced and consumed in the
+        # same frame, so the fixed order below is the single sequencing point
+        # (auto-flip first, then NEXT; click + SPACE in one frame is one NEXT)
+        if (not model.showing_back) and (time_since_next >= policy.flip_delay_s):
+            model = flip(model)  # [WHAT]
+            face = back_rt
+            dirty = True
+        if next_requested:
+            # [HOW] randomness at edge
+            if not bag:
+                bag = refill_bag(len(word_pairs), avoid=model.current)
+            chosen = bag.pop()
+            model = next_card(model, chosen)  # [WHAT]
+            bake_card(model.current)  # [HOW] recompose off-screen once
+            face = front_rt
+            time_since_next = 0.0  # [WHEN] reset timer at edge
+            dirty = True
+
+        # Compose (edge): only on frames where the model changed
+        if dirty:
+            begin_texture_mode(scene_rt)
+            clear_background(bg_color)
+            begin_blend_mode(BLEND_CUSTOM_SEPARATE)
+
+            # Card (pre-baked base + text)
+            draw_texture_rec(face.texture, face_src, card_pos, WHITE)
+
+            # Buttons (simple sprites + hitboxes)
+            draw_rectangle_lines_ex(wrong_rect, 2, BLACK)
+            draw_rectangle_lines_ex(right_rect, 2, BLACK)
+            draw_texture_ex(
+                wrong_tex,
+                wrong_pos,
+                0.0,
+                wrong_scale,
+                WHITE,
+            )
+            draw_texture_ex(
+                right_tex,
+                right_pos,
+                0.0,
+                right_scale,
+                WHITE,
+            )
+
+            end_blend_mode()
+            end_texture_mode()
+            dirty = False
+
+        # Draw (edge): present the cached scene
+        begin_drawing()
+        clear_background(bg_color)
+        draw_texture_rec(scene_rt.texture, scene_src, origin, WHITE)
+        end_drawing()
 
     # [HOW] shutdown edge
+    rl.unload_render_texture(scene_rt)
+    rl.unload_render_texture(front_rt)
+    rl.unload_render_texture(back_rt)
     rl.unload_texture(card_front)
     rl.unload_texture(card_back)
     rl.unload_texture(wrong_tex)
@@ -13,16 +13,26 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import functools
+import hashlib
+import io
+import os
 import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from enum import Enum, auto
 from pathlib import Path
-from typing import Tuple, Any
+from typing import Any, Callable, NamedTuple, Tuple
 
 import toga
 from toga.constants import CENTER
 from toga.style.pack import Pack
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# [HOW] register Pillow's core codecs (PNG among them) once, at import
+Image.preinit()
 
 # =========================
 # Domain data (values only)
@@ -32,24 +42,31 @@ BG = "#b4ddc7"
 
 
 # [VALUES][DATA>SYNTAX] plain, immutable domain items
-@dataclass(frozen=True)
-class WordPair:
+# [NOTE] a NamedTuple hashes with the C tuple hash; every render cache keys on it
+class WordPair(NamedTuple):
     fr: str
     en: str
 
 
-# [VALUES] container for already-rendered images (value semantics at call sites)
-@dataclass(frozen=True)
+# [VALUES] container for already-rendered word boxes (value semantics at call sites)
+# [NOTE] only the word box differs between cards, so that is all a card stores:
+#        a small patch per side; the shared bases stay on the Theme
+@dataclass(frozen=True, eq=False)
 class CardImages:
     # Core holds Pillow images only (UI-agnostic)
-    front: Image.Image
-    back: Image.Image
+    front_patch: Image.Image
+    back_patch: Image.Image
+    front_xy: Tuple[int, int]
+    back_xy: Tuple[int, int]
 
 
 # [VALUES][DATA>SYNTAX] theme/config as pure data (no I/O here)
-@dataclass(frozen=True)
+# [NOTE] eq=False: hashed by identity (PIL images aren't hashable), so a loaded
+#        Theme can key the render cache
+@dataclass(frozen=True, eq=False, slots=True)
 class Theme:
     # Preloaded, value-only assets (no I/O during render)
+    # Base images already carry the policy titles (baked in load_theme)
     base_front_img: Image.Image
     base_back_img: Image.Image
     title_font: ImageFont.FreeTypeFont
@@ -61,7 +78,7 @@ class Theme:
 
 
 # [VALUES] keep policy as data; separates policy from behavior implementation
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Policy:
     front_title: str = "French"
     back_title: str = "English"
@@ -94,9 +111,14 @@ def next_card(model: Model, chosen: WordPair) -> Model:
     return replace(model, current=chosen, showing_back=False)
 
 
-# [WHAT] rendering is a pure function of (model, theme, policy)
-def render(model: Model, theme: Theme, policy: Policy) -> CardImages:
-    return render_card(model.current, theme, policy)
+# [WHAT] what the side on show is made of: shared base + the card's patch and box
+def _side(
+    model: Model, theme: Theme, policy: Policy
+) -> tuple[Image.Image, Image.Image, Tuple[int, int]]:
+    card = render_card(model.current, theme, policy)
+    if model.showing_back:
+        return theme.base_back_img, card.back_patch, card.back_xy
+    return theme.base_front_img, card.front_patch, card.front_xy
 
 
 # =========================
@@ -104,44 +126,110 @@ def render(model: Model, theme: Theme, policy: Policy) -> CardImages:
 # =========================
 
 
+# [HOW] one FreeType user at a time (faces are not thread-safe); cache hits skip it
+_FONT_LOCK = threading.Lock()
+
+
+# [WHAT] rasterized text as an alpha mask + offset of its top-left from the
+# anchor point ("mm"); cached per (text, font) so FreeType runs once per string
+@functools.lru_cache(maxsize=4096)
+def _text_mask(
+    text: str, font: ImageFont.FreeTypeFont
+) -> tuple[Image.Image, Tuple[int, int]]:
+    with _FONT_LOCK:
+        left, top, right, bottom = font.getbbox(text, anchor="mm")
+        mask = Image.new("L", (right - left, bottom - top))
+        ImageDraw.Draw(mask).text((-left, -top), text, anchor="mm", font=font, fill=255)
+    return mask, (left, top)
+
+
 # [WHAT][DATA>SYNTAX] render uses only data; no disk/net I/O; copies to ·eserve value semantics
+# [NOTE] pure over hashable values, so memoized: revisiting a card is a dict hit
+#        (callers must treat the cached images as read-only)
+@functools.lru_cache(maxsize=4096)
 def render_card(words: WordPair, theme: Theme, policy: Policy) -> CardImages:
-    # Copy preloaded base images (value semantics); no disk or font I/O here
-    front_pil = theme.base_front_img.copy()
-    back_pil = theme.base_back_img.copy()
-    df = ImageDraw.Draw(front_pil)
-    df.text(
-        theme.title_pos,
-        policy.front_title,
-        anchor="mm",
-        font=theme.title_font,
-        fill=policy.title_color,
-    )
-    df.text(
-        theme.word_pos,
-        words.fr,
-        anchor="mm",
-        font=theme.word_font,
-        fill=policy.word_color,
-    )
-
-    db = ImageDraw.Draw(back_pil)
-    db.text(
-        theme.title_pos,
-        policy.back_title,
-        anchor="mm",
-        font=theme.title_font,
-        fill=policy.title_color,
-    )
-    db.text(
-        theme.word_pos,
-        words.en,
-        anchor="mm",
-        font=theme.word_font,
-        fill=policy.word_color,
-    )
+    return _card_renderer(theme, policy)(words)
+
+
+# [WHAT] the layout is fixed once a theme is loaded: specialize the card
+# renderer per (theme, policy) with every constant already bound, so a
+# render only varies in the two words
+@functools.lru_cache(maxsize=8)
+def _card_renderer(theme: Theme, policy: Policy) -> Callable[[WordPair], CardImages]:
+    # Titles are already baked into the bases; only the word box is drawn
+    front_base = theme.base_front_img
+    back_base = theme.base_back_img
+    font = theme.word_font
+    pos = theme.word_pos
+    # [NOTE] resolve the color name once; paste() would re-parse it per call
+    ink = ImageColor.getcolor(policy.word_color, front_base.mode)
+
+    def render_words(words: WordPair) -> CardImages:
+        front_patch, front_xy = _word_patch(front_base, words.fr, font, pos, ink)
+        back_patch, back_xy = _word_patch(back_base, words.en, font, pos, ink)
+        return CardImages(
+            front_patch=front_patch,
+            back_patch=back_patch,
+            front_xy=front_xy,
+            back_xy=back_xy,
+        )
 
-    return CardImages(front=front_pil, back=back_pil)
+    return render_words
+
+
+# [WHAT] dirty rectangle: crop the base under the word box and blend the ink
+# through the cached mask (one C-level composite over the box only)
+def _word_patch(
+    base: Image.Image,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    pos: Tuple[int, int],
+    ink: Tuple[int, ...],
+) -> tuple[Image.Image, Tuple[int, int]]:
+    mask, (dx, dy) = _text_mask(text, font)
+    x = pos[0] + dx
+    y = pos[1] + dy
+    patch = base.crop((x, y, x + mask.width, y + mask.height))
+    patch.paste(ink, (0, 0), mask)
+    return patch, (x, y)
+
+
+# [HOW] per-thread scratch canvas per base; render_png composes into it
+# instead of allocating a fresh ~1 MB copy for every side it encodes
+_SCRATCH = threading.local()
+
+
+def _scratch(base: Image.Image) -> Image.Image:
+    canvases = _SCRATCH.__dict__.setdefault("canvases", {})
+    entry = canvases.get(id(base))
+    if entry is None or entry[0] is not base:
+        entry = canvases[id(base)] = (base, base.copy())
+    return entry[1]
+
+
+# [WHAT] the PNG Toga would otherwise encode from the PIL image on assignment;
+# pure Pillow work, so it can be produced off the UI thread
+# [NOTE] the scratch canvas never escapes: only the encoded bytes do
+@functools.lru_cache(maxsize=64)
+def render_png(model: Model, theme: Theme, policy: Policy) -> bytes:
+    base, patch, xy = _side(model, theme, policy)
+    canvas = _scratch(base)
+    canvas.paste(base, (0, 0))  # reset in place; the buffer is reused
+    canvas.paste(patch, xy)
+    buf = io.BytesIO()
+    # [NOTE] fastest deflate level: the bytes never leave memory, so size
+    #        matters far less than encode time
+    canvas.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+# [HOW] render the whole (small, bounded) deck up front, fanned out over a pool
+# [NOTE] glyph rasterization is serialized by _FONT_LOCK; crops/pastes overlap.
+#        Only the word patches are warmed; full sides are composed when shown.
+def render_deck(word_pairs: tuple[WordPair, ...], theme: Theme, policy: Policy) -> None:
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for _ in pool.map(lambda words: render_card(words, theme, policy), word_pairs):
+            pass
 
 
 # =========================
@@ -153,29 +241,102 @@ def render_card(words: WordPair, theme: Theme, policy: Policy) -> CardImages:
 def load_word_pairs(csv_path: Path) -> tuple[WordPair, ...]:
     rows: list[WordPair] = []
     with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        # [NOTE] plain reader + header indices; no per-row dict like DictReader
+        reader = csv.reader(f)
         # Expect headers: French,English
+        header = next(reader, [])
+        if "French" not in header or "English" not in header:
+            return ()
+        fi = header.index("French")
+        ei = header.index("English")
+        width = max(fi, ei)
         for row in reader:
-            fr = (row.get("French") or "").strip()
-            en = (row.get("English") or "").strip()
+            if len(row) <= width:
+                continue
+            fr = row[fi].strip()
+            en = row[ei].strip()
             if fr and en:
-                rows.append(WordPair(fr=fr, en=en))
+                # interned: cache-key compares hit the identity fast path
+                rows.append(WordPair(fr=sys.intern(fr), en=sys.intern(en)))
     return tuple(rows)
 
 
+# [HOW] shuffled bag: each card once per pass, O(1) draws via pop()
+# [NOTE] `avoid` keeps the card on screen from coming up first after a refill,
+#        so a NEXT always changes the image
+def refill_bag(
+    word_pairs: tuple[WordPair, ...], avoid: WordPair | None = None
+) -> list[WordPair]:
+    bag = list(word_pairs)
+    random.shuffle(bag)
+    if len(bag) > 1 and bag[-1] == avoid:
+        bag[0], bag[-1] = bag[-1], bag[0]
+    return bag
+
+
+# [WHAT] opaque RGB card: the PNG's transparent corners matted onto the page
+# background, which is exactly what the ImageView showed over BG anyway
+def _flatten(img: Image.Image, background: str) -> Image.Image:
+    rgba = img.convert("RGBA")
+    flat = Image.new("RGB", rgba.size, background)
+    flat.paste(rgba, (0, 0), rgba)
+    return flat
+
+
+# [HOW] edge I/O: decoded, flattened RGB for a PNG, memoized on disk as raw pixels
+# [NOTE] keyed on a hash of the PNG bytes + background, so an edited asset is
+#        re-decoded; a cache that can't be written is simply skipped
+def _load_base(png_path: Path, cache_dir: Path | None) -> Image.Image:
+    with Image.open(png_path) as img:  # lazy: header only, gives the size
+        if cache_dir is None:
+            return _flatten(img, BG)
+        key = png_path.read_bytes() + BG.encode()
+        digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+        raw_path = cache_dir / f"{png_path.stem}_{digest}.raw"
+        w, h = img.size
+        try:
+            raw = raw_path.read_bytes()
+            if len(raw) == w * h * 3:
+                return Image.frombytes("RGB", (w, h), raw)
+        except OSError:
+            pass
+        flat = _flatten(img, BG)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = raw_path.with_suffix(".tmp")
+        tmp.write_bytes(flat.tobytes())
+        os.replace(tmp, raw_path)
+    except OSError:
+        pass
+    return flat
+
+
 # [HOW] edge I/O (FS/font decode). Returns pure Theme [VALUES].
-def load_theme(resources: Path) -> Theme:
-    # Preload images and fonts once; hand pure values to render()
-    base_front = Image.open(resources / "images" / "card_front.png").convert("RGBA")
-    base_back = Image.open(resources / "images" / "card_back.png").convert("RGBA")
+def load_theme(resources: Path, policy: Policy, cache_dir: Path | None = None) -> Theme:
+    # Preload images and fonts once; hand pure values to render_png()
+    # [NOTE] bases are opaque RGB: a quarter fewer bytes through every crop,
+    #        paste, scratch reset and PNG encode downstream
+    base_front = _load_base(resources / "images" / "card_front.png", cache_dir)
+    base_back = _load_base(resources / "images" / "card_back.png", cache_dir)
     title_font = ImageFont.truetype(str(resources / "fonts" / "Roboto-Italic.ttf"), 40)
     word_font = ImageFont.truetype(str(resources / "fonts" / "Roboto-Bold.ttf"), 60)
-    return Theme(
+    theme = Theme(
         base_front_img=base_front,
         base_back_img=base_back,
         title_font=title_font,
         word_font=word_font,
     )
+    # Titles never change per card: bake them into the bases once, in place
+    # [NOTE] same mask + paste path as the words; no RGBA text draw
+    ink = ImageColor.getcolor(policy.title_color, base_front.mode)
+    x, y = theme.title_pos
+    for img, title in (
+        (base_front, policy.front_title),
+        (base_back, policy.back_title),
+    ):
+        mask, (dx, dy) = _text_mask(title, title_font)
+        img.paste(ink, (x + dx, y + dy), mask)
+    return theme
 
 
 # =========================
@@ -189,6 +350,15 @@ class Event(Enum):
     AUTO_FLIP = auto()
 
 
+# [WHAT] a NEXT makes everything queued before it moot (the card it would
+# act on is replaced), so a burst of clicks draws one card, not one per click
+def _collapse(batch: list[Event]) -> list[Event]:
+    for i in range(len(batch) - 1, -1, -1):
+        if batch[i] is Event.NEXT:
+            return batch[i:]
+    return batch
+
+
 # =========================
 # App (UI edge)
 # =========================
@@ -201,21 +371,33 @@ class Milo(toga.App):
         # Data
         # [HOW] edge loads; passes [VALUES] into core
         self.word_pairs = load_word_pairs(resources / "data" / "french_words.csv")
-        self.theme = load_theme(resources)
         self.policy = Policy()
+        self.theme = load_theme(resources, self.policy, self.paths.cache)
+
+        # [HOW] render every card's word boxes once at startup (warms render_card)
+        render_deck(self.word_pairs, self.theme, self.policy)
 
         # Model (pure state)
         # [HOW] randomness lives at edge; chosen value fed into [WHAT]
-        self.model = Model(current=random.choice(self.word_pairs))
+        self._bag = refill_bag(self.word_pairs)
+        self.model = Model(current=self._bag.pop())
+
+        # [HOW] Toga re-encodes a PIL image on every ImageView assignment, so
+        # each rendered side is converted to a native toga.Image once and reused
+        @functools.lru_cache(maxsize=64)
+        def view_image(model: Model) -> toga.Image:
+            return toga.Image(render_png(model, self.theme, self.policy))
+
+        self._view_image = view_image
 
         # UI widgets (Toga ImageView accepts PIL images)
         # [WHAT] render → [HOW] assign to UI
-        imgs = render(self.model, self.theme, self.policy)
         w, h = self.theme.canvas_size
         self.card_view = toga.ImageView(
-            image=imgs.front,
+            image=self._view_image(self.model),
             style=Pack(width=w, height=h),
         )
+        self._shown_model: Model = self.model  # [VALUES] what the view holds
 
         # [SMALL-IFACE] buttons emit intents (no state change here)
         self.wrong_btn = toga.Button(
@@ -290,6 +472,10 @@ class Milo(toga.App):
         # [QUEUES] decouple when/where from what; centralize sequencing
         self.event_queue: asyncio.Queue[Event] = asyncio.Queue()
 
+        # [WHEN] one long-lived flip scheduler; NEXT only moves its deadline
+        self._flip_deadline = 0.0  # loop.time() at which AUTO_FLIP is due
+        self._flip_armed = asyncio.Event()
+
         # Keep task handles so we can cancel on exit.
         self.flip_task: asyncio.Task[None] | None = None
         self.reducer_task: asyncio.Task[None] | None = None
@@ -307,17 +493,41 @@ class Milo(toga.App):
         # Use the app's loop explicitly (avoid asyncio.get_running_loop()).
         if self.reducer_task is None or self.reducer_task.done():
             self.reducer_task = self.loop.create_task(self._run_loop())
+        if self.flip_task is None or self.flip_task.done():
+            self.flip_task = self.loop.create_task(self._flip_scheduler())
 
         # Kick off first timed flip
         self._start_flip_timer(
             self.policy.flip_delay_s
         )  # [WHEN] scheduling at the edge
+        self._prepare_ahead()
 
     # ----- View refresh -----
     # [HOW] UI binding layer; consumes pure render output; no domain logic here
     def _refresh_view(self) -> None:
-        imgs = render(self.model, self.theme, self.policy)
-        self.card_view.image = imgs.back if self.model.showing_back else imgs.front
+        # [NOTE] models are values: an equal model means an identical image, so
+        #        skip the ImageView rebind (and its re-encode) entirely
+        if self.model == self._shown_model:
+            return
+        self._shown_model = self.model
+        self.card_view.image = self._view_image(self.model)
+
+    # [HOW] double-buffer: build the images that can be shown next (this card's
+    # back, the next card's front) while the current one is on screen. Pillow
+    # work runs in the default executor; only the native handoff is on the loop.
+    def _prepare_ahead(self) -> None:
+        upcoming = [flip(self.model)]
+        if self._bag:
+            upcoming.append(Model(current=self._bag[-1]))
+        for model in upcoming:
+            fut = self.loop.run_in_executor(
+                None, render_png, model, self.theme, self.policy
+            )
+            fut.add_done_callback(functools.partial(self._prepared, model))
+
+    def _prepared(self, model: Model, fut: asyncio.Future[bytes]) -> None:
+        if not fut.cancelled() and fut.exception() is None:
+            self._view_image(model)  # warm the toga.Image cache on the loop
 
     # ----- Event reducer loop (single "when/where") -----
     # [WHAT+WHEN NOTE] reducer updates model (what) *and* triggers timers (when) — a tiny braid.
@@ -325,20 +535,31 @@ class Milo(toga.App):
     async def _run_loop(self) -> None:
         try:
             while True:
-                event = await self.event_queue.get()
-                if event is Event.NEXT:
-                    chosen = random.choice(
-                        self.word_pairs
-                    )  # [HOW] randomness at the edge
-                    self.model = next_card(self.model, chosen)  # [WHAT]
-                    self._start_flip_timer(self.policy.flip_delay_s)  # [WHEN]
-                elif event is Event.AUTO_FLIP and not self.model.showing_back:
-                    self.model = flip(self.model)  # [WHAT]
+                batch = [await self.event_queue.get()]
+                # [QUEUES] take the whole backlog, fold it, then draw once
+                while not self.event_queue.empty():
+                    batch.append(self.event_queue.get_nowait())
+                for event in _collapse(batch):
+                    self._reduce(event)
                 self._refresh_view()
+                self._prepare_ahead()
         except asyncio.CancelledError:
             # Normal shutdown path (window close cancels reducer_task)
             return
 
+    def _reduce(self, event: Event) -> None:
+        if event is Event.NEXT:
+            chosen = self._next_pair()  # [HOW] randomness at the edge
+            self.model = next_card(self.model, chosen)  # [WHAT]
+            self._start_flip_timer(self.policy.flip_delay_s)  # [WHEN]
+        elif event is Event.AUTO_FLIP and not self.model.showing_back:
+            self.model = flip(self.model)  # [WHAT]
+
+    def _next_pair(self) -> WordPair:
+        if not self._bag:
+            self._bag = refill_bag(self.word_pairs, avoid=self.model.current)
+        return self._bag.pop()
+
     # ----- Timer management -----
     # [WHEN/WHERE] explicit time handling at the boundary (clock edge)
     def _cancel_flip_timer(self) -> None:
@@ -347,20 +568,24 @@ class Milo(toga.App):
             t.cancel()
 
     def _start_flip_timer(self, delay_s: float) -> None:
-        self._cancel_flip_timer()
+        # [NOTE] no task per event: (re)arming is just a deadline write
+        self._flip_deadline = self.loop.time() + delay_s
+        self._flip_armed.set()
 
-        async def _later() -> None:
-            try:
-                await asyncio.sleep(delay_s)  # [WHEN]
-                await self.event_queue.put(
-                    Event.AUTO_FLIP
-                )  # [QUEUES] schedule next intent
-            except asyncio.CancelledError:
-                pass
-
-        # Use the app loop explicitly (matches the BeeWare handlers example style,
-        # but avoids relying on a "running loop" lookup).
-        self.flip_task = self.loop.create_task(_later())
+    async def _flip_scheduler(self) -> None:
+        try:
+            while True:
+                await self._flip_armed.wait()
+                # Deadline may have moved while we slept; sleep off the rest
+                remaining = self._flip_deadline - self.loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)  # [WHEN]
+                    continue
+                self._flip_armed.clear()
+                self.event_queue.put_nowait(Event.AUTO_FLIP)  # [QUEUES]
+        except asyncio.CancelledError:
+            # Normal shutdown path (window close cancels flip_task)
+            return
 
     # ----- Button callbacks (edges emit intents) -----
     # [SMALL-IFACE][QUEUES] translate UI actions into intents; no state mutation here
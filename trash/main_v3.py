@@ -1,10 +1,17 @@
 # milo_simple.py (rewritten with fixes 1–4)
 import asyncio
 import csv
+import functools
+import io
+import os
 import random
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Protocol, Callable, Awaitable, Optional, Tuple
+from typing import Protocol, Callable, Optional, Tuple
 
 # --- PIL (pure rendering) ---
 from PIL import Image, ImageDraw, ImageFont
@@ -63,17 +70,43 @@ class Theme:
     base_back: Image.Image
     title_font: ImageFont.FreeTypeFont
     word_font: ImageFont.FreeTypeFont
+    # Titles are the same on every card: rasterized once into tight RGBA
+    # overlays, alpha-composited at these top-left offsets
+    title_front_layer: Image.Image
+    title_back_layer: Image.Image
+    title_front_xy: Tuple[int, int]
+    title_back_xy: Tuple[int, int]
+    # Built once: every render() uses it in its cache key
+    key: Tuple = field(init=False, repr=False, compare=False)
 
-    @property
-    def key(self) -> Tuple:
-        return self.spec.key()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", self.spec.key())
 
 
 @dataclass(frozen=True)
 class CardImages:
+    # Read-only by convention: the renderer caches and shares these, so
+    # consumers must never draw into them
     front: Image.Image
     back: Image.Image
 
+    # Encoded once per side on first use: what an image widget is built from,
+    # so rebuilding one never re-walks the full canvas
+    @functools.cached_property
+    def front_png(self) -> bytes:
+        return encode_png(self.front)
+
+    @functools.cached_property
+    def back_png(self) -> bytes:
+        return encode_png(self.back)
+
+
+def encode_png(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    # Fastest deflate level: the bytes stay in memory, encode time dominates
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
 
 # =========================
 # Rules layer (policies)
@@ -86,14 +119,26 @@ class SelectionPolicy(Protocol):
 
 
 class RandomSelection:
+    def __init__(self) -> None:
+        self._corpus: tuple[WordPair, ...] = ()
+        self._index_of: dict[WordPair, int] = {}
+
     def initial(self, corpus: tuple[WordPair, ...]) -> WordPair:
         return random.choice(corpus)
 
     def next(self, current: WordPair, corpus: tuple[WordPair, ...]) -> WordPair:
-        if not corpus:
-            return current
-        nxt = random.choice(corpus)
-        return nxt if nxt != current else random.choice(corpus)
+        if len(corpus) < 2:
+            return corpus[0] if corpus else current
+        if corpus is not self._corpus:  # index built once per corpus
+            self._corpus = corpus
+            self._index_of = {wp: i for i, wp in enumerate(corpus)}
+        cur = self._index_of.get(current)
+        if cur is None:
+            return random.choice(corpus)
+        # Uniform over every other card with a single draw: pick from n - 1
+        # slots and step over the current one
+        i = random.randrange(len(corpus) - 1)
+        return corpus[i if i < cur else i + 1]
 
 
 @dataclass(frozen=True)
@@ -111,53 +156,65 @@ class FlipPolicy:
 @dataclass
 class CardRenderer:
     theme: Theme
-    _cache: dict[Tuple[str, str, Tuple], CardImages] = field(default_factory=dict)
+    # LRU: most recently used last, bounded so only the working set stays
+    # resident: two 800x526 RGBA sides are ~3.4 MB a card, ~110 MB at 32
+    max_cards: int = 32
+    _cache: OrderedDict[Tuple[str, str, Tuple], CardImages] = field(
+        default_factory=OrderedDict
+    )
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # render() may run on worker threads; FreeType faces aren't thread-safe, so
+    # only rasterization is serialized (copies and composites run in parallel)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
-    def render(self, words: WordPair) -> CardImages:
+    def cached(self, words: WordPair) -> Optional[CardImages]:
+        # Cache lookup only (marks a hit as recently used); never renders
         key = (words.fr, words.en, self.theme.key)
-        imgs = self._cache.get(key)
+        with self._cache_lock:
+            imgs = self._cache.get(key)
+            if imgs:
+                self._cache.move_to_end(key)
+            return imgs
+
+    def render(self, words: WordPair) -> CardImages:
+        imgs = self.cached(words)
         if imgs:
             return imgs
 
+        # Words are rasterized into a bbox-sized mask and stamped over just
+        # that region, not drawn through the full canvas
+        spec = self.theme.spec
+        font = self.theme.word_font
+        with self._lock:
+            fr_mask, fr_xy = render_text_mask(words.fr, font, spec.word_pos)
+            en_mask, en_xy = render_text_mask(words.en, font, spec.word_pos)
+
         f = self.theme.base_front.copy()
         b = self.theme.base_back.copy()
 
-        df = ImageDraw.Draw(f)
-        df.text(
-            self.theme.spec.title_pos,
-            "French",
-            anchor="mm",
-            font=self.theme.title_font,
-            fill=self.theme.spec.title_color,
-        )
-        df.text(
-            self.theme.spec.word_pos,
-            words.fr,
-            anchor="mm",
-            font=self.theme.word_font,
-            fill=self.theme.spec.word_color,
-        )
+        f.alpha_composite(self.theme.title_front_layer, self.theme.title_front_xy)
+        f.paste(spec.word_color, fr_xy, fr_mask)
 
-        db = ImageDraw.Draw(b)
-        db.text(
-            self.theme.spec.title_pos,
-            "English",
-            anchor="mm",
-            font=self.theme.title_font,
-            fill=self.theme.spec.title_color,
-        )
-        db.text(
-            self.theme.spec.word_pos,
-            words.en,
-            anchor="mm",
-            font=self.theme.word_font,
-            fill=self.theme.spec.word_color,
-        )
+        b.alpha_composite(self.theme.title_back_layer, self.theme.title_back_xy)
+        b.paste(spec.word_color, en_xy, en_mask)
 
         imgs = CardImages(front=f, back=b)
-        self._cache[key] = imgs
+        # A racing render of the same pair just overwrites an equal value
+        key = (words.fr, words.en, self.theme.key)
+        with self._cache_lock:
+            self._cache[key] = imgs
+            if len(self._cache) > self.max_cards:
+                self._cache.popitem(last=False)
         return imgs
 
+    def prewarm(self, corpus: tuple[WordPair, ...]) -> None:
+        # Render up to a cache-full of cards once up front so next() is mostly
+        # a cache hit; anything past max_cards would only be evicted again.
+        # Fanned out over threads (Pillow drops the GIL for copy/composite)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for _ in pool.map(self.render, corpus[: self.max_cards]):
+                pass
+
 
 # =========================
 # Events (typed, no strings)
@@ -175,12 +232,12 @@ class Event(Enum):
 
 
 class ViewPort(Protocol):
-    def show(self, front: Image.Image, back: Image.Image, show_back: bool) -> None: ...
+    def show(self, card: CardImages, show_back: bool) -> None: ...
     def update_side(self, show_back: bool) -> None: ...
 
 
 class Scheduler(Protocol):
-    async def run(self, publish: Callable[[Event], Awaitable[None]]) -> None: ...
+    async def run(self, publish: Callable[[Event], None]) -> None: ...
 
 
 # =========================
@@ -188,6 +245,7 @@ class Scheduler(Protocol):
 # =========================
 
 TARGET_W, TARGET_H = 540, 420
+VIEW_CACHE_SIZE = 32  # each view holds a native full-size bitmap
 
 
 class TogaViewPort(ViewPort):
@@ -197,36 +255,52 @@ class TogaViewPort(ViewPort):
         self.slot = slot  # dedicated container we control
         self.width = width
         self.height = height
-        self.front_view: Optional[toga.ImageView] = None
-        self.back_view: Optional[toga.ImageView] = None
+        self._card: Optional[CardImages] = None
         self._showing_back = False
-
-    def show(self, front: Image.Image, back: Image.Image, show_back: bool) -> None:
-        # Fix 1: copy() here to avoid aliasing cached images
-        self.front_view = toga.ImageView(
-            front.copy(), style=Pack(width=self.width, height=self.height)
-        )
-        self.back_view = toga.ImageView(
-            back.copy(), style=Pack(width=self.width, height=self.height)
-        )
+        # Built views, most recently used last, keyed by (id() of their cached,
+        # read-only card, side); the entry holds the card so the id stays unique
+        self._views: OrderedDict[
+            tuple[int, bool], tuple[CardImages, toga.ImageView]
+        ] = OrderedDict()
+
+    def show(self, card: CardImages, show_back: bool) -> None:
+        # Only the visible side gets a view now; the other is built on first flip
+        self._card = card
         self._showing_back = show_back
-        view = self.back_view if show_back else self.front_view
-        if self.slot.children:
-            self.slot.replace(self.slot.children[0], view)
-        else:
-            self.slot.add(view)
+        self._mount(self._view(show_back))
 
     def update_side(self, show_back: bool) -> None:
-        if self.front_view is None or self.back_view is None:
+        if self._card is None:
             return
         if show_back == self._showing_back:
             return
         self._showing_back = show_back
-        new_view = self.back_view if show_back else self.front_view
-        if self.slot.children:
-            self.slot.replace(self.slot.children[0], new_view)
-        else:
-            self.slot.add(new_view)
+        self._mount(self._view(show_back))
+
+    def _mount(self, view: toga.ImageView) -> None:
+        if not self.slot.children:
+            self.slot.add(view)
+        elif self.slot.children[0] is not view:
+            self.slot.replace(self.slot.children[0], view)
+
+    def _view(self, back: bool) -> toga.ImageView:
+        card = self._card
+        assert card is not None
+        key = (id(card), back)
+        entry = self._views.get(key)
+        if entry is not None and entry[0] is card:
+            self._views.move_to_end(key)
+            return entry[1]
+        # Built from the card's cached PNG: no defensive copy (CardImages are
+        # read-only) and no per-widget re-encode of the PIL image
+        png = card.back_png if back else card.front_png
+        view = toga.ImageView(
+            toga.Image(png), style=Pack(width=self.width, height=self.height)
+        )
+        self._views[key] = (card, view)
+        if len(self._views) > VIEW_CACHE_SIZE:
+            self._views.popitem(last=False)
+        return view
 
 
 class IntervalScheduler(Scheduler):
@@ -236,12 +310,29 @@ class IntervalScheduler(Scheduler):
         self.policy = policy
         self.event = event
 
-    async def run(self, publish: Callable[[Event], Awaitable[None]]) -> None:
+    async def run(self, publish: Callable[[Event], None]) -> None:
         if not self.policy.auto_flip:
             return
-        while True:
-            await asyncio.sleep(self.policy.interval_sec)
-            await publish(self.event)
+        # One self re-arming timer handle instead of a sleep() future per tick;
+        # ticks are pinned to absolute loop times, so they don't drift either.
+        # After a stall the schedule re-anchors instead of replaying every
+        # missed tick: FLIP toggles, so a burst would flicker
+        loop = asyncio.get_running_loop()
+        interval = self.policy.interval_sec
+        event = self.event
+        due = loop.time() + interval
+
+        def tick() -> None:
+            nonlocal due, handle
+            due = max(due + interval, loop.time() + interval)
+            handle = loop.call_at(due, tick)
+            publish(event)
+
+        handle = loop.call_at(due, tick)
+        try:
+            await loop.create_future()  # park until cancelled
+        finally:
+            handle.cancel()
 
 
 # =========================
@@ -252,18 +343,25 @@ class IntervalScheduler(Scheduler):
 class AsyncEventBus:
     def __init__(self):
         self._q: asyncio.Queue[Event] = asyncio.Queue()
-        self._handlers: list[Callable[[Event], None]] = []
+        # Tuple, rebuilt on subscribe (rare): pump (hot) can iterate it safely
+        # without a defensive copy per event
+        self._handlers: tuple[Callable[[Event], None], ...] = ()
 
     def subscribe(self, handler: Callable[[Event], None]) -> None:
-        self._handlers.append(handler)
+        self._handlers = (*self._handlers, handler)
 
     async def publish(self, evt: Event) -> None:
         await self._q.put(evt)
 
+    def publish_nowait(self, evt: Event) -> None:
+        # The queue is unbounded, so this never blocks: callers from sync code
+        # (UI callbacks, timer handles) needn't wrap publish() in a Task
+        self._q.put_nowait(evt)
+
     async def pump(self) -> None:
         while True:
             evt = await self._q.get()
-            for h in list(self._handlers):
+            for h in self._handlers:
                 h(evt)
 
 
@@ -291,6 +389,12 @@ class Controller:
 
         self.current: WordPair = self.selection.initial(self.corpus)
         self.showing_back: bool = False
+        self._next_task: Optional[asyncio.Task[None]] = None
+        # The flip policy is fixed for the session: resolve it into the
+        # dispatch table once instead of testing it on every event
+        self._dispatch: dict[Event, Callable[[], None]] = {Event.NEXT: self.next}
+        if flip_policy.auto_flip:
+            self._dispatch[Event.FLIP] = self.flip
 
         self._render_and_show()
 
@@ -299,25 +403,42 @@ class Controller:
     # intents
     def flip(self) -> None:
         self.showing_back = not self.showing_back
-        self.viewport.update_side(self.showing_back)
+        # While the next card is still rendering, the side is held and applied
+        # when it is shown, not sent to the old card
+        if self._next_task is None:
+            self.viewport.update_side(self.showing_back)
 
     def next(self) -> None:
         self.current = self.selection.next(self.current, self.corpus)
         # reset to front; policy choice, but explicit:
         self.showing_back = False
-        self._render_and_show()
+        imgs = self.renderer.cached(self.current)
+        if imgs is not None:
+            # Cache hit: show inline, in event order
+            self._next_task = None
+            self.viewport.show(imgs, self.showing_back)
+            return
+        # keep a reference so the task isn't garbage-collected mid-flight
+        self._next_task = asyncio.create_task(self._show_when_rendered(self.current))
 
     # internal
     def _render_and_show(self) -> None:
         imgs = self.renderer.render(self.current)
-        self.viewport.show(imgs.front, imgs.back, self.showing_back)
+        self.viewport.show(imgs, self.showing_back)
+
+    async def _show_when_rendered(self, words: WordPair) -> None:
+        # Render off the event loop: a cold-cache PIL render must not stall it
+        imgs = await asyncio.to_thread(self.renderer.render, words)
+        if words is not self.current:
+            return  # superseded by a later next() while rendering
+        self._next_task = None
+        self.viewport.show(imgs, self.showing_back)
 
     # event handler (typed)
     def _on_event(self, evt: Event) -> None:
-        if evt is Event.FLIP and self.flip_policy.auto_flip:
-            self.flip()
-        elif evt is Event.NEXT:
-            self.next()
+        handler = self._dispatch.get(evt)
+        if handler is not None:
+            handler()
 
 
 # =========================
@@ -326,30 +447,69 @@ class Controller:
 
 
 def load_csv_word_pairs(path: str) -> tuple[WordPair, ...]:
-    out: list[WordPair] = []
     with open(path, newline="", encoding="utf-8") as f:
-        rdr = csv.reader(f)
-        for row in rdr:
-            if len(row) < 2:
-                continue
-            fr, en = row[0].strip(), row[1].strip()
-            if (fr, en) == ("French", "English"):
-                continue
-            out.append(WordPair(fr=fr, en=en))
-    return tuple(out)
+        text = f.read()
+    # Plain "fr,en" lines need no CSV state machine: one C-level split per
+    # line. Files with quoted fields still go through csv.reader.
+    if '"' in text:
+        rows = [row[:2] for row in csv.reader(io.StringIO(text)) if len(row) >= 2]
+    else:
+        rows = [line.split(",", 2)[:2] for line in text.splitlines() if "," in line]
+    pairs = [(fr.strip(), en.strip()) for fr, en in rows]
+    # Interned: the renderer's cache keys then compare by identity
+    return tuple(
+        WordPair(fr=sys.intern(fr), en=sys.intern(en))
+        for fr, en in pairs
+        if (fr, en) != ("French", "English")
+    )
+
+
+def render_text_mask(
+    text: str, font: ImageFont.FreeTypeFont, pos: Tuple[int, int]
+) -> tuple[Image.Image, Tuple[int, int]]:
+    # Tight-bbox coverage mask of `text` centered ("mm") on `pos`, plus the
+    # top-left offset to stamp it at. Pasting a solid color through it onto
+    # an opaque canvas matches drawing the text in place.
+    left, top, right, bottom = font.getbbox(text, anchor="mm")
+    mask = Image.new("L", (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), text, anchor="mm", font=font, fill=255)
+    return mask, (pos[0] + left, pos[1] + top)
+
+
+def render_text_layer(
+    text: str, font: ImageFont.FreeTypeFont, pos: Tuple[int, int], color: str
+) -> tuple[Image.Image, Tuple[int, int]]:
+    # Tight-bbox RGBA overlay of `text`: solid color with coverage in alpha,
+    # so alpha-compositing it matches drawing the text in place.
+    mask, xy = render_text_mask(text, font, pos)
+    layer = Image.new("RGBA", mask.size, color)
+    layer.putalpha(mask)
+    return layer, xy
 
 
 def load_theme(spec: ThemeSpec) -> Theme:
     title_font = ImageFont.truetype(spec.title_font_path, spec.title_font_size)
     word_font = ImageFont.truetype(spec.word_font_path, spec.word_font_size)
-    base_front = Image.open(spec.front_path)
-    base_back = Image.open(spec.back_path)
+    # Decode once, in the mode the compositor needs: Image.open is lazy, and
+    # alpha_composite requires RGBA, so every later copy() is a plain memcpy
+    base_front = Image.open(spec.front_path).convert("RGBA")
+    base_back = Image.open(spec.back_path).convert("RGBA")
+    front_layer, front_xy = render_text_layer(
+        "French", title_font, spec.title_pos, spec.title_color
+    )
+    back_layer, back_xy = render_text_layer(
+        "English", title_font, spec.title_pos, spec.title_color
+    )
     return Theme(
         spec=spec,
         base_front=base_front,
         base_back=base_back,
         title_font=title_font,
         word_font=word_font,
+        title_front_layer=front_layer,
+        title_back_layer=back_layer,
+        title_front_xy=front_xy,
+        title_back_xy=back_xy,
     )
 
 
@@ -370,6 +530,7 @@ class Milo(toga.App):
         )
         theme = load_theme(theme_spec)
         renderer = CardRenderer(theme)
+        renderer.prewarm(corpus)
 
         # --- UI skeleton (adapter host) ---
         self.main_window = toga.MainWindow()
@@ -413,14 +574,14 @@ class Milo(toga.App):
 
         # --- tasks (edges only) ---
         asyncio.create_task(self.bus.pump())
-        asyncio.create_task(self.flip_sched.run(self.bus.publish))
+        asyncio.create_task(self.flip_sched.run(self.bus.publish_nowait))
 
         # --- buttons (emit typed events, not mutate UI) ---
         next_btn = toga.Button(
-            "Next", on_press=lambda b: asyncio.create_task(self.bus.publish(Event.NEXT))
+            "Next", on_press=lambda b: self.bus.publish_nowait(Event.NEXT)
         )
         flip_btn = toga.Button(
-            "Flip", on_press=lambda b: asyncio.create_task(self.bus.publish(Event.FLIP))
+            "Flip", on_press=lambda b: self.bus.publish_nowait(Event.FLIP)
         )
         footer.add(next_btn, flip_btn)
 